@@ -1,19 +1,17 @@
 """AutoUAM - Automated Cloudflare Under Attack Mode management."""
 
-try:
-    from importlib.metadata import version
+from typing import TYPE_CHECKING
 
-    __version__ = version("autouam")
-except ImportError:
-    __version__ = "unknown"
+from ._version import __version__
 
 __author__ = "Ike Hecht"
 __email__ = "contact@wikiteq.com"
 
-from .config.settings import Settings
-from .core.cloudflare import CloudflareClient
-from .core.monitor import LoadMonitor
-from .core.uam_manager import UAMManager
+if TYPE_CHECKING:
+    from .config.settings import Settings
+    from .core.cloudflare import CloudflareClient
+    from .core.monitor import LoadMonitor
+    from .core.uam_manager import UAMManager
 
 __all__ = [
     "LoadMonitor",
@@ -22,3 +20,25 @@ __all__ = [
     "Settings",
     "__version__",
 ]
+
+# Map public names to their defining submodules so `import autouam` stays
+# cheap; the heavy dependency trees (aiohttp, pydantic) are only pulled in
+# when one of these symbols is actually accessed (PEP 562).
+_LAZY_IMPORTS = {
+    "Settings": "autouam.config.settings",
+    "CloudflareClient": "autouam.core.cloudflare",
+    "LoadMonitor": "autouam.core.monitor",
+    "UAMManager": "autouam.core.uam_manager",
+}
+
+
+def __getattr__(name: str):
+    module_name = _LAZY_IMPORTS.get(name)
+    if module_name is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
+    import importlib
+
+    value = getattr(importlib.import_module(module_name), name)
+    globals()[name] = value
+    return value
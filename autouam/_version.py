@@ -0,0 +1,7 @@
+"""Package version for AutoUAM.
+
+Single source of truth for the package version; also read by setuptools
+via ``[tool.setuptools.dynamic]`` in pyproject.toml.
+"""
+
+__version__ = "1.0.0a7"
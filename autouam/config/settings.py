@@ -2,7 +2,7 @@
 
 import os
 from pathlib import Path
-from typing import Any
+from typing import Any, ClassVar, Literal
 
 from pydantic import BaseModel, Field
 from pydantic_settings import BaseSettings
@@ -46,9 +46,14 @@ class SecurityConfig(BaseModel):
 class LoggingConfig(BaseModel):
     """Logging configuration."""
 
+    # Fields are validated at construction only; plain attribute assignment
+    # afterwards skips re-validation (explicit here so it survives a change
+    # of project-wide defaults).
+    model_config = {"validate_assignment": False}
+
     level: str = "INFO"
     format: str = "json"
-    output: str = "file"
+    output: Literal["stdout", "stderr", "file"] = "file"
     file_path: str | None = "/var/log/autouam.log"
     max_size_mb: int = 100
     max_backups: int = 5
@@ -89,6 +94,10 @@ class Settings(BaseSettings):
         "extra": "ignore",
     }
 
+    # Parsed-file cache keyed by (path, mtime); a rewrite of the same path
+    # changes the mtime and naturally invalidates the entry.
+    _file_cache: ClassVar[dict] = {}
+
     @classmethod
     def _substitute_env_vars(cls, data: Any) -> Any:
         """Recursively substitute environment variables in configuration data."""
@@ -112,17 +121,80 @@ class Settings(BaseSettings):
             return data
 
     @classmethod
-    def from_file(cls, config_path: Path) -> "Settings":
-        """Load settings from a configuration file."""
-        import yaml
+    def from_dict(cls, config_data: dict[str, Any]) -> "Settings":
+        """Create settings from an already-parsed configuration mapping.
 
-        with open(config_path) as f:
-            config_data = yaml.safe_load(f) or {}
+        Lets callers that hold the configuration in memory skip the YAML
+        round-trip while getting the same environment-variable substitution
+        and validation as from_file.
+        """
+        return cls(**cls._substitute_env_vars(config_data))
 
-        # Handle environment variable substitution
-        config_data = cls._substitute_env_vars(config_data)
-
-        return cls(**config_data)
+    @classmethod
+    def from_file(cls, config_path: Path, write_cache: bool = False) -> "Settings":
+        """Load settings from a configuration file.
+
+        Repeated loads of an unchanged file are served from a cache so the
+        YAML parse and validation run once per file version. A JSON sidecar
+        (<config>.cache.json) additionally survives process restarts: when
+        it is at least as new as the YAML it is loaded instead, which is
+        several times cheaper than a YAML parse. The sidecar duplicates the
+        raw config contents, so it is only written when write_cache is set
+        (and then with owner-only permissions); plain loads never modify
+        the config directory.
+        """
+        import json
+
+        key = (str(config_path), os.path.getmtime(config_path))
+        config_path = Path(config_path)
+        config_mtime = key[1]
+        sidecar = config_path.with_suffix(config_path.suffix + ".cache.json")
+
+        try:
+            sidecar_fresh = sidecar.stat().st_mtime >= config_mtime
+        except OSError:
+            sidecar_fresh = False
+
+        # The memory cache only short-circuits when no sidecar write is
+        # pending; otherwise a plain load earlier in the process would turn
+        # a later write_cache=True call into a silent no-op.
+        cached = cls._file_cache.get(key)
+        if cached is not None and (sidecar_fresh or not write_cache):
+            return cached
+
+        config_data = None
+        if sidecar_fresh:
+            try:
+                config_data = json.loads(sidecar.read_bytes())
+            except (OSError, ValueError):
+                config_data = None  # corrupt sidecar; reparse below
+
+        if config_data is None:
+            import yaml
+
+            try:
+                from yaml import CSafeLoader as YamlLoader  # libyaml C backend
+            except ImportError:  # pragma: no cover - depends on PyYAML build
+                from yaml import SafeLoader as YamlLoader
+
+            with open(config_path) as f:
+                config_data = yaml.load(f, Loader=YamlLoader) or {}
+
+            if write_cache:
+                try:
+                    # 0600 so the sidecar never widens access to secrets
+                    # held in the config (the original may be 0600 itself).
+                    fd = os.open(sidecar, os.O_WRONLY | os.O_CREAT | os.O_TRUNC, 0o600)
+                    try:
+                        os.write(fd, json.dumps(config_data).encode())
+                    finally:
+                        os.close(fd)
+                except (OSError, TypeError):
+                    pass  # best effort; read-only dir or non-JSON YAML types
+
+        settings = cls.from_dict(config_data)
+        cls._file_cache[key] = settings
+        return settings
 
     def to_dict(self) -> dict[str, Any]:
         """Convert settings to dictionary."""
@@ -1,10 +1,10 @@
 """Load average monitoring for AutoUAM."""
 
+import heapq
 import os
 import time
-from collections import deque
+from array import array
 from dataclasses import dataclass
-from typing import Deque, Tuple
 
 from ..logging.setup import get_logger
 
@@ -24,51 +24,127 @@ class LoadAverage:
         return self.five_minute
 
 
+@dataclass
+class LoadEvaluation:
+    """Result of checking one load sample against both thresholds."""
+
+    is_high: bool
+    is_low: bool
+    normalized_load: float
+    upper_threshold: float
+    lower_threshold: float
+    used_relative: bool
+
+
 class LoadBaseline:
     """Calculate and maintain load average baseline."""
 
     def __init__(self, max_samples: int = 1440):  # 24 hours at 1-minute intervals
         self.logger = get_logger(__name__)
-        self.samples: Deque[Tuple[float, float]] = deque(maxlen=max_samples)
+        self.max_samples = max_samples
+        # Parallel ring buffers of contiguous doubles (structure-of-arrays)
+        # instead of one (load, timestamp) tuple object per sample.
+        self._loads = array("d", bytes(8 * max_samples))
+        self._timestamps = array("d", bytes(8 * max_samples))
+        self._next = 0
+        self._count = 0
+        self._dirty = False
         self.last_update: float = 0.0
         self.baseline: float | None = None
+        # Relative thresholds are invariant between baseline refreshes, so
+        # the products are cached here instead of recomputed per check.
+        self._upper_multiplier = 2.0
+        self._lower_multiplier = 1.5
+        self.relative_upper: float | None = None
+        self.relative_lower: float | None = None
+
+    def __len__(self) -> int:
+        return self._count
 
     def add_sample(self, normalized_load: float, timestamp: float) -> None:
         """Add a new load sample."""
-        self.samples.append((normalized_load, timestamp))
-
-    def calculate_baseline(self, hours: int = 24) -> float | None:
+        self._loads[self._next] = normalized_load
+        self._timestamps[self._next] = timestamp
+        self._next = (self._next + 1) % self.max_samples
+        if self._count < self.max_samples:
+            self._count += 1
+        self._dirty = True
+
+    def calculate_baseline(
+        self, hours: int = 24, now: float | None = None
+    ) -> float | None:
         """Calculate baseline from recent samples."""
-        if not self.samples:
+        if not self._count:
             return None
 
-        # Filter samples from the last N hours
-        cutoff_time = time.time() - (hours * 3600)
-        recent_samples = [load for load, ts in self.samples if ts >= cutoff_time]
+        if now is None:
+            now = time.time()
+
+        # No new samples since the last calculation; the percentile of the
+        # same data would come out unchanged, so skip the recompute.
+        if not self._dirty and self.baseline is not None:
+            return self.baseline
+
+        # Filter samples from the last N hours; bind the buffers to locals
+        # so the comprehension skips two attribute lookups per sample
+        cutoff_time = now - (hours * 3600)
+        loads = self._loads
+        timestamps = self._timestamps
+        recent_samples = [
+            loads[i] for i in range(self._count) if timestamps[i] >= cutoff_time
+        ]
 
         if len(recent_samples) < 2:
             return None
 
-        # Use 95th percentile as baseline (handles spikes better than mean)
-        sorted_samples = sorted(recent_samples)
-        index = int(len(sorted_samples) * 0.95)
-        baseline = sorted_samples[min(index, len(sorted_samples) - 1)]
+        # Use 95th percentile as baseline (handles spikes better than mean).
+        # Partial selection of the top ~5% beats sorting all samples.
+        index = min(int(len(recent_samples) * 0.95), len(recent_samples) - 1)
+        baseline = heapq.nlargest(len(recent_samples) - index, recent_samples)[-1]
 
         self.baseline = baseline
-        self.last_update = time.time()
+        self._dirty = False
+        self._recompute_relative_thresholds()
+        self.last_update = now
 
         self.logger.info(
             f"Baseline calculated: {baseline:.2f} from {len(recent_samples)} samples"
         )
         return baseline
 
+    def set_multipliers(self, upper: float, lower: float) -> None:
+        """Set relative-threshold multipliers, refreshing cached products."""
+        if (upper, lower) != (self._upper_multiplier, self._lower_multiplier):
+            self._upper_multiplier = upper
+            self._lower_multiplier = lower
+            self._recompute_relative_thresholds()
+
+    def _recompute_relative_thresholds(self) -> None:
+        """Recompute the cached baseline * multiplier products."""
+        if self.baseline is None:
+            self.relative_upper = None
+            self.relative_lower = None
+        else:
+            self.relative_upper = self.baseline * self._upper_multiplier
+            self.relative_lower = self.baseline * self._lower_multiplier
+
     def get_baseline(self) -> float | None:
         """Get current baseline value."""
         return self.baseline
 
-    def should_update_baseline(self, interval_seconds: int) -> bool:
+    def should_update_baseline(
+        self, interval_seconds: int, now: float | None = None
+    ) -> bool:
         """Check if baseline should be updated."""
-        return time.time() - self.last_update >= interval_seconds
+        if now is None:
+            now = time.time()
+        return now - self.last_update >= interval_seconds
+
+
+def _detect_cpu_count() -> int:
+    """Resolve the number of CPU cores, defaulting to 1."""
+    cpu_count = os.cpu_count()
+    return cpu_count if cpu_count and cpu_count > 0 else 1
 
 
 class LoadMonitor:
@@ -77,16 +153,66 @@ class LoadMonitor:
     def __init__(self):
         self.logger = get_logger(__name__)
         self.baseline = LoadBaseline()
+        # CPU topology does not change at runtime; resolve it once instead
+        # of calling os.cpu_count() on every load normalization.
+        self._cpu_count = _detect_cpu_count()
+        self._last_load: LoadAverage | None = None
+        # Cached read-only fd for /proc/loadavg: one pread per tick instead
+        # of libc getloadavg()'s open/read/close. None on non-Linux hosts,
+        # which fall back to os.getloadavg().
+        self._loadavg_fd = self._open_loadavg()
+        # Reused result container for get_system_info: the daemon and the
+        # health endpoint poll it continuously, so the dicts are allocated
+        # once and mutated in place rather than rebuilt per call.
+        self._info_buf: dict = {
+            "load_average": {
+                "one_minute": 0.0,
+                "five_minute": 0.0,
+                "fifteen_minute": 0.0,
+                "normalized": 0.0,
+            },
+            "cpu_count": 0,
+            "timestamp": 0.0,
+        }
 
-    def get_load_average(self) -> LoadAverage:
+    @staticmethod
+    def _open_loadavg() -> int | None:
+        """Open /proc/loadavg once for reuse, or None where unavailable."""
+        try:
+            return os.open("/proc/loadavg", os.O_RDONLY)
+        except OSError:
+            return None
+
+    def close(self) -> None:
+        """Release the cached /proc/loadavg descriptor, if any."""
+        fd = getattr(self, "_loadavg_fd", None)
+        self._loadavg_fd = None
+        if fd is not None:
+            try:
+                os.close(fd)
+            except OSError:
+                pass
+
+    def __del__(self) -> None:
+        self.close()
+
+    def get_load_average(self, now: float | None = None) -> LoadAverage:
         """Get current load average."""
         try:
-            load_avgs = os.getloadavg()
+            if self._loadavg_fd is not None:
+                parts = os.pread(self._loadavg_fd, 64, 0).split(b" ", 3)
+                one, five, fifteen = (
+                    float(parts[0]),
+                    float(parts[1]),
+                    float(parts[2]),
+                )
+            else:
+                one, five, fifteen = os.getloadavg()
             return LoadAverage(
-                one_minute=load_avgs[0],
-                five_minute=load_avgs[1],
-                fifteen_minute=load_avgs[2],
-                timestamp=time.time(),
+                one_minute=one,
+                five_minute=five,
+                fifteen_minute=fifteen,
+                timestamp=now if now is not None else time.time(),
             )
         except OSError as e:
             self.logger.error(f"Failed to get load average: {e}")
@@ -94,14 +220,14 @@ class LoadMonitor:
 
     def get_cpu_count(self) -> int:
         """Get the number of CPU cores."""
-        cpu_count = os.cpu_count()
-        return cpu_count if cpu_count and cpu_count > 0 else 1
+        return self._cpu_count
 
-    def get_normalized_load(self) -> float:
+    def get_normalized_load(self, now: float | None = None) -> float:
         """Get load average normalized by CPU count."""
-        load_avg = self.get_load_average()
+        load_avg = self.get_load_average(now)
         cpu_count = self.get_cpu_count()
         normalized = load_avg.average / cpu_count
+        self._last_load = load_avg
 
         # Add to baseline for historical tracking
         self.baseline.add_sample(normalized, load_avg.timestamp)
@@ -136,28 +262,97 @@ class LoadMonitor:
 
         return normalized_load < threshold
 
-    def get_system_info(self) -> dict:
-        """Get system information for monitoring."""
-        load_avg = self.get_load_average()
+    def evaluate(
+        self,
+        upper_threshold: float,
+        lower_threshold: float,
+        use_relative: bool = False,
+        upper_multiplier: float = 2.0,
+        lower_multiplier: float = 1.5,
+        now: float | None = None,
+    ) -> LoadEvaluation:
+        """Check both thresholds against a single load sample.
+
+        Sampling once per call means one os.getloadavg() and one baseline
+        sample per monitoring tick, instead of separate fetches (and
+        double-counted samples) for the high and low checks.
+        """
+        normalized_load = self.get_normalized_load(now)
+
+        used_relative = False
+        if use_relative:
+            self.baseline.set_multipliers(upper_multiplier, lower_multiplier)
+            if self.baseline.relative_upper is not None:
+                upper_threshold = self.baseline.relative_upper
+                lower_threshold = self.baseline.relative_lower
+                used_relative = True
+
+        return LoadEvaluation(
+            is_high=normalized_load > upper_threshold,
+            is_low=normalized_load < lower_threshold,
+            normalized_load=normalized_load,
+            upper_threshold=upper_threshold,
+            lower_threshold=lower_threshold,
+            used_relative=used_relative,
+        )
+
+    def _read_process_counts(self) -> tuple[int, int] | None:
+        """Read running/total process counts from /proc/loadavg.
+
+        The file is a fixed-layout single line; scanning the raw bytes for
+        the fourth column avoids decoding and materializes two ints only.
+        Returns None where /proc is unavailable.
+        """
+        try:
+            if self._loadavg_fd is not None:
+                buf = os.pread(self._loadavg_fd, 64, 0)
+            else:
+                with open("/proc/loadavg", "rb") as f:
+                    buf = f.read()
+            procs = buf.split(b" ", 4)[3]
+            slash = procs.index(b"/")
+            return int(procs[:slash]), int(procs[slash + 1 :])
+        except (OSError, ValueError, IndexError):
+            return None
+
+    def get_system_info(self, max_age: float = 1.0) -> dict:
+        """Get system information for monitoring.
+
+        Reuses the reading taken by the most recent threshold evaluation
+        when it is younger than max_age seconds, so health polling that
+        coincides with a monitoring tick does not fetch the load twice.
+
+        The returned dict is a shared buffer overwritten by the next call;
+        callers that keep it across calls should take a copy.
+        """
+        load_avg = self._last_load
+        if load_avg is None or time.time() - load_avg.timestamp > max_age:
+            load_avg = self.get_load_average()
         cpu_count = self.get_cpu_count()
         normalized_load = load_avg.average / cpu_count
 
-        info = {
-            "load_average": {
-                "one_minute": load_avg.one_minute,
-                "five_minute": load_avg.five_minute,
-                "fifteen_minute": load_avg.fifteen_minute,
-                "normalized": normalized_load,
-            },
-            "cpu_count": cpu_count,
-            "timestamp": load_avg.timestamp,
-        }
+        info = self._info_buf
+        load_info = info["load_average"]
+        load_info["one_minute"] = load_avg.one_minute
+        load_info["five_minute"] = load_avg.five_minute
+        load_info["fifteen_minute"] = load_avg.fifteen_minute
+        load_info["normalized"] = normalized_load
+        info["cpu_count"] = cpu_count
+        info["timestamp"] = load_avg.timestamp
+
+        if (process_counts := self._read_process_counts()) is not None:
+            running, total = process_counts
+            info["processes"] = {"running": running, "total": total}
+        else:
+            info.pop("processes", None)
 
         if (baseline := self.baseline.get_baseline()) is not None:
             info["baseline"] = {
                 "value": baseline,
                 "ratio_to_baseline": normalized_load / baseline if baseline > 0 else 0,
-                "samples_count": len(self.baseline.samples),
+                "samples_count": len(self.baseline),
             }
+        else:
+            info.pop("baseline", None)
 
         return info
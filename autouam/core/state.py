@@ -1,8 +1,9 @@
 """State management for AutoUAM."""
 
 import json
+import os
 import time
-from dataclasses import asdict, dataclass
+from dataclasses import dataclass
 from pathlib import Path
 from typing import Any
 
@@ -21,7 +22,17 @@ class UAMState:
 
     def to_dict(self) -> dict[str, Any]:
         """Convert to dictionary."""
-        return asdict(self)
+        # All fields are flat scalars; a literal dict avoids the field
+        # introspection and recursive copying dataclasses.asdict performs.
+        return {
+            "is_enabled": self.is_enabled,
+            "last_check": self.last_check,
+            "load_average": self.load_average,
+            "threshold_used": self.threshold_used,
+            "reason": self.reason,
+            "enabled_at": self.enabled_at,
+            "disabled_at": self.disabled_at,
+        }
 
 
 class StateManager:
@@ -29,7 +40,12 @@ class StateManager:
 
     def __init__(self, state_file: str | None = None):
         self.state_file = state_file or "/var/lib/autouam/state.json"
+        # Path objects are built once here instead of per call
+        self._state_path = Path(self.state_file)
+        self._state_dir = self._state_path.parent
+        self._temp_path = self._state_path.with_suffix(self._state_path.suffix + ".tmp")
         self._state: UAMState | None = None
+        self._last_payload: bytes | None = None
 
     def get_initial_state(self) -> UAMState:
         """Get initial state."""
@@ -48,10 +64,9 @@ class StateManager:
         if self._state is not None:
             return self._state
 
-        state_path = Path(self.state_file)
-        if state_path.exists():
+        if self._state_path.exists():
             try:
-                with open(state_path) as f:
+                with open(self._state_path) as f:
                     data = json.load(f)
                 self._state = UAMState(**data)
             except Exception:
@@ -65,18 +80,27 @@ class StateManager:
         """Save state to file."""
         self._state = state
         try:
-            state_path = Path(self.state_file)
-            state_path.parent.mkdir(parents=True, exist_ok=True)
-            with open(state_path, "w") as f:
-                json.dump(state.to_dict(), f, indent=2)
+            payload = json.dumps(state.to_dict(), separators=(",", ":")).encode()
+            if payload == self._last_payload:
+                return  # Nothing changed on disk-worthy fields; skip the write
+
+            self._state_dir.mkdir(parents=True, exist_ok=True)
+            self._temp_path.write_bytes(payload)
+            os.replace(self._temp_path, self._state_path)
+            self._last_payload = payload
         except Exception:
             pass  # Continue without persistence if file operations fail
 
     def update_state(
-        self, is_enabled: bool, load_average: float, threshold_used: float, reason: str
+        self,
+        is_enabled: bool,
+        load_average: float,
+        threshold_used: float,
+        reason: str,
+        now: float | None = None,
     ) -> UAMState:
         """Update state with new information."""
-        current_time = time.time()
+        current_time = now if now is not None else time.time()
         state = self.load_state()
 
         was_enabled = state.is_enabled
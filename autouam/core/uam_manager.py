@@ -1,11 +1,12 @@
 """UAM management logic for AutoUAM."""
 
 import asyncio
+import time
 
 from ..config.settings import Settings
 from ..logging.setup import get_logger
 from .cloudflare import CloudflareClient
-from .monitor import LoadMonitor
+from .monitor import LoadEvaluation, LoadMonitor
 from .state import StateManager
 
 
@@ -51,58 +52,54 @@ class UAMManager:
     async def _monitoring_cycle(self) -> None:
         """Execute one monitoring cycle."""
         try:
+            thresholds = self.config.monitoring.load_thresholds
+            # One wall-clock read per tick, shared by every consumer below
+            now = time.time()
+
             # Update baseline if needed
             if self.monitor.baseline.should_update_baseline(
-                self.config.monitoring.load_thresholds.baseline_update_interval
+                thresholds.baseline_update_interval, now
             ):
                 self.monitor.baseline.calculate_baseline(
-                    self.config.monitoring.load_thresholds.baseline_calculation_hours
+                    thresholds.baseline_calculation_hours, now
                 )
 
-            load_average = self.monitor.get_normalized_load()
+            # Sample the load once and check both thresholds against it
+            evaluation = self.monitor.evaluate(
+                thresholds.upper,
+                thresholds.lower,
+                use_relative=thresholds.use_relative_thresholds,
+                upper_multiplier=thresholds.relative_upper_multiplier,
+                lower_multiplier=thresholds.relative_lower_multiplier,
+                now=now,
+            )
             current_state = self.state_manager.load_state()
 
-            await self._evaluate_and_act(load_average, current_state)
+            await self._evaluate_and_act(evaluation, current_state)
 
         except Exception as e:
             self.logger.error(f"Monitoring cycle error: {e}")
 
-    async def _evaluate_and_act(self, load_average: float, current_state) -> None:
-        """Evaluate load and take appropriate action."""
-        thresholds = self.config.monitoring.load_thresholds
+    async def _evaluate_and_act(
+        self, evaluation: LoadEvaluation, current_state
+    ) -> None:
+        """Act on a threshold evaluation."""
+        relative_suffix = " (relative)" if evaluation.used_relative else ""
 
-        # Determine thresholds to use
-        use_relative = (
-            thresholds.use_relative_thresholds
-            and self.monitor.baseline.get_baseline() is not None
-        )
+        if evaluation.is_high and not current_state.is_enabled:
+            reason = f"High load detected{relative_suffix}"
+            await self._enable_uam(
+                evaluation.normalized_load, evaluation.upper_threshold, reason
+            )
 
-        if use_relative:
-            upper_threshold = (
-                self.monitor.baseline.get_baseline() or 0
-            ) * thresholds.relative_upper_multiplier
-            lower_threshold = (
-                self.monitor.baseline.get_baseline() or 0
-            ) * thresholds.relative_lower_multiplier
-        else:
-            upper_threshold = thresholds.upper
-            lower_threshold = thresholds.lower
-
-        # Check thresholds
-        is_high_load = load_average > upper_threshold
-        is_low_load = load_average < lower_threshold
-
-        # Take action
-        if is_high_load and not current_state.is_enabled:
-            reason = "High load detected" + (" (relative)" if use_relative else "")
-            await self._enable_uam(load_average, upper_threshold, reason)
-
-        elif is_low_load and current_state.is_enabled:
+        elif evaluation.is_low and current_state.is_enabled:
             if self.state_manager.can_disable_uam(
                 self.config.monitoring.minimum_uam_duration
             ):
-                reason = "Load normalized" + (" (relative)" if use_relative else "")
-                await self._disable_uam(load_average, lower_threshold, reason)
+                reason = f"Load normalized{relative_suffix}"
+                await self._disable_uam(
+                    evaluation.normalized_load, evaluation.lower_threshold, reason
+                )
 
     async def _enable_uam(
         self, load_average: float, threshold: float, reason: str
@@ -196,9 +193,16 @@ class UAMManager:
             return {"error": "Failed to initialize"}
 
         try:
-            load_average = self.monitor.get_normalized_load()
+            thresholds = self.config.monitoring.load_thresholds
+            evaluation = self.monitor.evaluate(
+                thresholds.upper,
+                thresholds.lower,
+                use_relative=thresholds.use_relative_thresholds,
+                upper_multiplier=thresholds.relative_upper_multiplier,
+                lower_multiplier=thresholds.relative_lower_multiplier,
+            )
             current_state = self.state_manager.load_state()
-            await self._evaluate_and_act(load_average, current_state)
+            await self._evaluate_and_act(evaluation, current_state)
             return self.get_status()
         except Exception as e:
             return {"error": str(e)}
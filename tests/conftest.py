@@ -1,37 +1,73 @@
 """Common test fixtures and utilities for AutoUAM tests."""
 
-import tempfile
-from pathlib import Path
-from unittest.mock import AsyncMock, MagicMock
+import logging
 
 import pytest
 import yaml
 
 from autouam.config.settings import Settings
-
-
-@pytest.fixture
+from autouam.logging import setup as logging_setup
+from tests.utils import (
+    create_mock_cloudflare_client,
+    create_sample_settings,
+    create_temp_config_file,
+)
+
+
+@pytest.fixture(autouse=True)
+def _clean_logging():
+    """Snapshot and restore the autouam logger around each test.
+
+    setup_logging re-runs whenever a CLI command is invoked; without this,
+    handlers (and queue-listener threads) started in one test would leak
+    into the next and fan out every subsequent log record.
+    """
+    logger = logging.getLogger("autouam")
+    saved_handlers = logger.handlers[:]
+    saved_level = logger.level
+    yield
+    for handler in logger.handlers:
+        if handler not in saved_handlers:
+            handler.close()
+    logger.handlers[:] = saved_handlers
+    logger.setLevel(saved_level)
+    logging_setup._stop_queue_listener()
+
+
+# The temp-config content never changes, so it is serialized once at import
+# instead of re-running the YAML emitter for every test that uses the fixture.
+_TEMP_CONFIG_DATA = {
+    "cloudflare": {
+        "api_token": "${CF_API_TOKEN}",
+        "email": "contact@wikiteq.com",
+        "zone_id": "${CF_ZONE_ID}",
+    },
+    "monitoring": {
+        "check_interval": 10,
+        "load_thresholds": {"upper": 30.0, "lower": 10.0},
+        "minimum_uam_duration": 600,
+    },
+    "logging": {
+        "level": "DEBUG",
+        "output": "file",
+        "format": "json",
+        "file_path": "/var/log/autouam.log",
+    },
+}
+_TEMP_CONFIG_YAML = yaml.safe_dump(_TEMP_CONFIG_DATA)
+
+
+@pytest.fixture(scope="session")
 def mock_settings():
-    """Create mock settings for testing."""
-    return Settings(
-        cloudflare={
-            "api_token": "test_token_123456789",
-            "email": "test@example.com",
-            "zone_id": "test_zone_123456789",
-        },
-        monitoring={
-            "check_interval": 5,
-            "load_thresholds": {"upper": 2.0, "lower": 1.0},
-            "minimum_uam_duration": 300,
-        },
-        logging={"level": "INFO", "output": "stdout", "format": "text"},
-        health={"enabled": True, "port": 8080},
-        deployment={"mode": "daemon"},
-        security={"regular_mode": "essentially_off"},
-    )
+    """Create mock settings for testing.
 
+    Session-scoped; tests that need to mutate the settings should work on
+    a model_copy(deep=True) of the instance.
+    """
+    return create_sample_settings()
 
-@pytest.fixture
+
+@pytest.fixture(scope="session")
 def mock_settings_with_relative_thresholds():
     """Create mock settings with relative thresholds enabled."""
     return Settings(
@@ -60,7 +96,7 @@ def mock_settings_with_relative_thresholds():
     )
 
 
-@pytest.fixture
+@pytest.fixture(scope="session")
 def mock_cloudflare_response():
     """Mock successful Cloudflare API response."""
     return {"result": {"security_level": "essentially_off"}, "success": True}
@@ -69,49 +105,18 @@ def mock_cloudflare_response():
 @pytest.fixture
 def mock_cloudflare_client():
     """Create a mock Cloudflare client."""
-    mock_client = MagicMock()
-    mock_client.__aenter__ = AsyncMock(return_value=mock_client)
-    mock_client.__aexit__ = AsyncMock(return_value=None)
-    mock_client.test_connection = AsyncMock(return_value=True)
-    return mock_client
+    return create_mock_cloudflare_client()
 
 
-@pytest.fixture
-def temp_config_file():
+@pytest.fixture(scope="session")
+def temp_config_file(tmp_path_factory):
     """Create a temporary configuration file."""
-    config_data = {
-        "cloudflare": {
-            "api_token": "${CF_API_TOKEN}",
-            "email": "contact@wikiteq.com",
-            "zone_id": "${CF_ZONE_ID}",
-        },
-        "monitoring": {
-            "check_interval": 10,
-            "load_thresholds": {"upper": 30.0, "lower": 10.0},
-            "minimum_uam_duration": 600,
-        },
-        "logging": {
-            "level": "DEBUG",
-            "output": "file",
-            "format": "json",
-            "file_path": "/var/log/autouam.log",
-        },
-    }
-
-    with tempfile.NamedTemporaryFile(mode="w", suffix=".yaml", delete=False) as f:
-        yaml.dump(config_data, f)
-        config_path = Path(f.name)
-
-    yield config_path
-
-    # Cleanup
-    config_path.unlink(missing_ok=True)
+    return create_temp_config_file(_TEMP_CONFIG_YAML, tmp_path_factory.mktemp("config"))
 
 
 @pytest.fixture
-def temp_state_dir():
+def temp_state_dir(tmp_path):
     """Create a temporary directory for state files."""
-    with tempfile.TemporaryDirectory() as temp_dir:
-        state_dir = Path(temp_dir) / "autouam"
-        state_dir.mkdir()
-        yield state_dir
+    state_dir = tmp_path / "autouam"
+    state_dir.mkdir()
+    return state_dir
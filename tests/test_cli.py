@@ -1,7 +1,5 @@
 """Tests for CLI functionality."""
 
-import tempfile
-from pathlib import Path
 from unittest.mock import AsyncMock, MagicMock, patch
 
 import pytest
@@ -19,7 +17,7 @@ class TestCLICommands:
         return CliRunner()
 
     @pytest.fixture
-    def temp_config_file(self):
+    def temp_config_file(self, tmp_path):
         """Create a temporary config file."""
         config_data = {
             "cloudflare": {
@@ -38,16 +36,11 @@ class TestCLICommands:
             "security": {"regular_mode": "essentially_off"},
         }
 
-        with tempfile.NamedTemporaryFile(mode="w", suffix=".yaml", delete=False) as f:
-            import yaml
+        import yaml
 
-            yaml.dump(config_data, f)
-            config_path = Path(f.name)
-
-        yield config_path
-
-        # Cleanup
-        config_path.unlink(missing_ok=True)
+        config_path = tmp_path / "config.yaml"
+        config_path.write_text(yaml.safe_dump(config_data))
+        return config_path
 
     def test_help_command(self, cli_runner):
         """Test help command."""
@@ -0,0 +1,38 @@
+"""Tests for logging setup."""
+
+import logging
+
+import pytest
+
+from autouam.logging.setup import _get_formatter, get_logger
+
+
+class TestGetFormatter:
+    """Test formatter selection."""
+
+    @pytest.mark.parametrize(
+        "format,expected_fragment",
+        [
+            ("json", '"level"'),
+            ("text", "%(name)s"),
+            ("invalid", "%(name)s"),  # Unknown formats fall back to text
+        ],
+    )
+    def test_get_formatter(self, format, expected_fragment):
+        """Test that each configured format maps to the right formatter."""
+        formatter = _get_formatter(format)
+        assert isinstance(formatter, logging.Formatter)
+        assert expected_fragment in formatter._fmt
+
+    def test_get_formatter_is_cached(self):
+        """Test that repeated lookups reuse the same formatter instance."""
+        assert _get_formatter("json") is _get_formatter("json")
+
+
+class TestGetLogger:
+    """Test logger naming."""
+
+    def test_get_logger_namespaced(self):
+        """Test that loggers are created under the autouam namespace."""
+        logger = get_logger("core.monitor")
+        assert logger.name == "autouam.core.monitor"
@@ -1,5 +1,6 @@
 """Tests for load monitoring functionality."""
 
+import os
 from unittest.mock import patch
 
 import pytest
@@ -7,6 +8,16 @@ import pytest
 from autouam.core.monitor import LoadAverage, LoadMonitor
 
 
+@pytest.fixture(autouse=True)
+def _force_getloadavg_fallback(monkeypatch):
+    """Route load reads through os.getloadavg so tests can patch one seam.
+
+    On Linux the monitor prefers a cached /proc/loadavg fd, which would
+    bypass the os.getloadavg patches used throughout this module.
+    """
+    monkeypatch.setattr(LoadMonitor, "_open_loadavg", staticmethod(lambda: None))
+
+
 class TestLoadAverage:
     """Test LoadAverage dataclass."""
 
@@ -51,6 +62,22 @@ class TestLoadMonitor:
         load_avg = monitor.get_load_average()
         assert load_avg.one_minute == 1.23
 
+    @pytest.mark.skipif(
+        not os.path.exists("/proc/loadavg"), reason="requires /proc/loadavg"
+    )
+    def test_get_load_average_proc_fast_path(self):
+        """Test the cached-fd /proc/loadavg read path."""
+        monitor = LoadMonitor()
+        monitor._loadavg_fd = os.open("/proc/loadavg", os.O_RDONLY)
+        try:
+            load_avg = monitor.get_load_average()
+        finally:
+            monitor.close()
+
+        assert load_avg.one_minute >= 0.0
+        assert load_avg.five_minute >= 0.0
+        assert load_avg.fifteen_minute >= 0.0
+
     @patch("os.getloadavg", side_effect=OSError("Load average unavailable"))
     def test_get_load_average_os_error(self, mock_getloadavg):
         """Test load average retrieval when system call fails."""
@@ -0,0 +1,29 @@
+"""Tests for package-level import behavior."""
+
+import subprocess
+import sys
+
+import autouam
+
+
+class TestPackageImport:
+    """Test package import cost and version handling."""
+
+    def test_version_is_constant(self):
+        """Test that __version__ is a plain string constant."""
+        assert isinstance(autouam.__version__, str)
+        assert autouam.__version__ != "unknown"
+
+    def test_import_does_not_load_heavy_dependencies(self):
+        """Test that importing autouam does not pull in importlib.metadata
+        or the heavy third-party dependency trees."""
+        code = (
+            "import sys; import autouam; "
+            "assert 'importlib.metadata' not in sys.modules; "
+            "assert 'aiohttp' not in sys.modules; "
+            "assert 'pydantic' not in sys.modules"
+        )
+        result = subprocess.run(
+            [sys.executable, "-c", code], capture_output=True, text=True
+        )
+        assert result.returncode == 0, result.stderr
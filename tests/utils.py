@@ -1,49 +1,65 @@
 """Utility functions for testing."""
 
+import functools
 import tempfile
 from contextlib import contextmanager
 from pathlib import Path
+from types import SimpleNamespace
 from typing import Any, Dict
 from unittest.mock import AsyncMock, MagicMock, patch
 
 from aiohttp import ClientResponseError
 
 from autouam.config.settings import Settings
-from autouam.core.cloudflare import CloudflareClient
+
+
+class FakeCloudflareClient:
+    """Lightweight CloudflareClient stand-in.
+
+    MagicMock(spec=CloudflareClient) re-introspects the class on every
+    instantiation and lazily builds child mocks per attribute access. This
+    plain class assigns just the methods tests use - as AsyncMocks, so
+    call assertions still work.
+    """
+
+    def __init__(self, api_token: str, zone_id: str, base_url: str):
+        self.api_token = api_token
+        self.zone_id = zone_id
+        self.base_url = base_url
+        self.test_connection = AsyncMock(return_value=True)
+        self.get_current_security_level = AsyncMock(return_value="essentially_off")
+        self.enable_under_attack_mode = AsyncMock(return_value=True)
+        self.disable_under_attack_mode = AsyncMock(return_value=True)
+        self._make_request = AsyncMock(return_value={"success": True})
+
+    async def __aenter__(self) -> "FakeCloudflareClient":
+        return self
+
+    async def __aexit__(self, *exc_info) -> None:
+        return None
 
 
 def create_mock_cloudflare_client(
     api_token: str = "test_token",
     zone_id: str = "test_zone",
     base_url: str = "https://api.cloudflare.com/client/v4",
-) -> MagicMock:
+) -> FakeCloudflareClient:
     """Create a mock CloudflareClient for testing."""
-    mock_client = MagicMock(spec=CloudflareClient)
-    mock_client.api_token = api_token
-    mock_client.zone_id = zone_id
-    mock_client.base_url = base_url
-
-    # Mock async methods
-    mock_client.test_connection = AsyncMock(return_value=True)
-    mock_client.get_current_security_level = AsyncMock(return_value="essentially_off")
-    mock_client.enable_under_attack_mode = AsyncMock(return_value=True)
-    mock_client.disable_under_attack_mode = AsyncMock(return_value=True)
-    mock_client._make_request = AsyncMock(return_value={"success": True})
-
-    # Mock context manager
-    mock_client.__aenter__ = AsyncMock(return_value=mock_client)
-    mock_client.__aexit__ = AsyncMock(return_value=None)
-
-    return mock_client
+    return FakeCloudflareClient(api_token, zone_id, base_url)
 
 
+@functools.lru_cache(maxsize=16)
 def create_api_error_response(
     status: int = 400, message: str = "Bad request"
 ) -> ClientResponseError:
-    """Create a mock API error response."""
+    """Create a mock API error response.
+
+    Cached per (status, message) since tests reuse the same few errors; a
+    SimpleNamespace stands in for request_info without MagicMock overhead.
+    """
     return ClientResponseError(
-        request_info=MagicMock(),
-        history=[],
+        request_info=SimpleNamespace(real_url="http://test", method="GET"),
+        history=(),
         status=status,
         message=message,
     )
@@ -90,8 +106,18 @@ def mock_load_monitor_methods(monitor_mock: MagicMock):
     monitor_mock.is_low_load.return_value = True
 
 
-def create_temp_config_file(content: str) -> Path:
-    """Create a temporary configuration file for testing."""
+def create_temp_config_file(content: str, directory: Path | None = None) -> Path:
+    """Create a temporary configuration file for testing.
+
+    Pass a pytest-managed directory (tmp_path / tmp_path_factory) so the
+    file is cleaned up with the test run; without one the caller owns the
+    unlink.
+    """
+    if directory is not None:
+        config_path = directory / "config.yaml"
+        config_path.write_text(content)
+        return config_path
+
     temp_file = tempfile.NamedTemporaryFile(mode="w", suffix=".yaml", delete=False)
     temp_file.write(content)
     temp_file.close()